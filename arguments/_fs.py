@@ -0,0 +1,26 @@
+import os
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def _stat(path: str):
+    # like Path.exists(), any path that cannot be stat-ed counts as missing. E.g. a symlink loop or
+    # a path with an embedded null byte
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def path_stat(path):
+    """Returns the os.stat result for path, or None if nothing exists there
+
+    Each distinct absolute path is stat-ed once. The one stat answers both whether a path exists
+    and what kind of file it is. Call clear_stat_cache() after creating or removing files.
+    """
+    return _stat(os.path.abspath(path))
+
+
+def clear_stat_cache():
+    """Forgets every cached stat result so the next path_stat() call looks at the disk again"""
+    _stat.cache_clear()
@@ -1,50 +1,209 @@
-import os
+import sys
+import stat
 import argparse
+import functools
+import itertools
+import logging
 from datetime import datetime
 from pathlib import Path
 
+from ._fs import path_stat
+
+logger = logging.getLogger(__name__)
+
+# (flags, add_argument keyword arguments) for every command-line option
+_ARG_SPECS = (
+    (
+        ("-d", "--direction"),
+        dict(
+            help="Which way to convert. GED2CSV or CSV2GED",
+            action="store",
+            type=str,
+            choices=["GED2CSV", "CSV2GED"],
+            required=True,
+            dest="dir",
+        ),
+    ),
+    (
+        ("-g", "--gedcom"),
+        dict(
+            help="File path to the gedcom file to be read or generated",
+            action="store",
+            type=Path,
+            required=False,
+            dest="gedcom_file",
+        ),
+    ),
+    (
+        ("-i", "--indi-file"),
+        dict(
+            help="File path to the indi csv file to be read or generated",
+            action="store",
+            type=Path,
+            required=False,
+            dest="indi_file",
+        ),
+    ),
+    (
+        ("-f", "--fam-file"),
+        dict(
+            help="File path to the fam csv file to be read or generated",
+            action="store",
+            type=Path,
+            required=False,
+            dest="fam_file",
+        ),
+    ),
+    (
+        ("-s", "--sour-file"),
+        dict(
+            help="File path to the sour csv file to be read or generated",
+            action="store",
+            type=Path,
+            required=False,
+            dest="sour_file",
+        ),
+    ),
+    (
+        ("-v", "--verbose"),
+        dict(
+            help="Verbose",
+            action="store_true",
+            dest="verbose",
+        ),
+    ),
+    (
+        ("--no-cont-conc",),
+        dict(
+            help="Do not attempt to handle CONT or CONC tags. Render <<MISSING DATA>> instead.",
+            action="store_true",
+            dest="no_cont_conc",
+        ),
+    ),
+    (
+        ("--force-string-dates",),
+        dict(
+            help="Prepend a `'` to the beginning of each date field value when converting GEDCOM to CSV.",
+            action="store_true",
+            dest="force_string_dates",
+        ),
+    ),
+)
+
+# (argument key, identifier, extension) used to derive a file path that was not provided
+_FILE_SPECS = (
+    ("gedcom_file", "gedcom", ".ged"),
+    ("indi_file", "indi", ".csv"),
+    ("fam_file", "fam", ".csv"),
+    ("sour_file", "sour", ".sour"),
+)
+
+
+def _validate_files(inputs: dict, outputs: dict):
+    """Yields an error for each input file that does not exist and each output file that does
+
+    inputs and outputs map a file's name in error messages to its path. Output files are not
+    checked once an input is missing, since the run is already rejected.
+    """
+    # every input file must exist. Anything but a directory can be read, e.g. a pipe or /dev/stdin
+    missing_input = False
+    for name, path in inputs.items():
+        st = path_stat(path)
+        if st is None:
+            missing_input = True
+            yield f"Invalid {name} file. File does not exist"
+        elif stat.S_ISDIR(st.st_mode):
+            missing_input = True
+            yield f"Invalid {name} file. Is a directory"
+
+    if missing_input:
+        return
+
+    # nothing may exist where an output file will be written
+    for name, path in outputs.items():
+        if path_stat(path) is not None:
+            yield f"Invalid {name} file. File already exists! I will not over-write a file!"
+
+
+def _validate_ged2csv(gedcom_file: Path, indi_file: Path, fam_file: Path, sour_file: Path):
+    """Validates file paths for GED2CSV: gedcom_file is read, the CSV files are written"""
+    return _validate_files(
+        inputs={"gedcom": gedcom_file},
+        outputs={"indi": indi_file, "fam": fam_file, "sour": sour_file},
+    )
+
+
+def _validate_csv2ged(gedcom_file: Path, indi_file: Path, fam_file: Path, sour_file: Path):
+    """Validates file paths for CSV2GED: the CSV files are read, gedcom_file is written"""
+    return _validate_files(
+        inputs={"indi": indi_file, "fam": fam_file, "sour": sour_file},
+        outputs={"gedcom": gedcom_file},
+    )
+
+
+# file path validation specialized for each direction
+_VALIDATORS = {
+    "GED2CSV": _validate_ged2csv,
+    "CSV2GED": _validate_csv2ged,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Builds the command-line parser from _ARG_SPECS the first time it is needed"""
+    ret = argparse.ArgumentParser(description="Convert GEDCOM files to CSV and CSV files to GEDCOM")
+    for flags, kwargs in _ARG_SPECS:
+        ret.add_argument(*flags, **kwargs)
+    return ret
+
 
 class Arguments:
-    def __init__(self):
-        self.dt = datetime.now().strftime("%Y%m%d-%H%M%S")
+    def __new__(cls):
+        # arguments are only parsed and validated once per distinct command line
+        return cls._cached(tuple(sys.argv))
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _cached(cls, argv):
+        ret = object.__new__(cls)
+        ret._init(argv)
+        return ret
+
+    @classmethod
+    def clear_cache(cls):
+        """Forgets previously processed command lines so the next Arguments() re-parses sys.argv"""
+        cls._cached.cache_clear()
 
+    def _init(self, argv):
         # get and store command-line args
-        self.raw_args = self.parse_args()
-
-        # simple check to ensure arguments check out basically
-        errors = self.validate_raw_args()
-
-        if not errors:
-            # derive file names if needed
-            self.processed_args = self.process_raw_args()
-
-            # Final validation. Files actually exist? etc..
-            errors.extend(
-                self.validate_args(
-                    direction=self.processed_args["direction"],
-                    gedcom_file=self.processed_args["gedcom_file"],
-                    indi_file=self.processed_args["indi_file"],
-                    fam_file=self.processed_args["fam_file"],
-                    sour_file=self.processed_args["sour_file"],
-                    no_cont_conc=self.processed_args["no_cont_conc"],
-                    force_string_dates=self.processed_args["force_string_dates"],
-                )
-            )
+        self.raw_args = self.parse_args(argv[1:])
+        self.ARGUMENTS_DEBUG = self.raw_args.verbose
 
-        if errors:
-            raise ValueError("\n".join([error for error in errors]))
+        # debug messages are only formatted when verbose output was requested
+        if self.ARGUMENTS_DEBUG:
+            logging.basicConfig(format="%(message)s", stream=sys.stdout)
+            logger.setLevel(logging.DEBUG)
+        else:
+            logger.setLevel(logging.WARNING)
 
+        errors = self.validate()
         if self.ARGUMENTS_DEBUG:
-            print("Set final arguments:")
+            # verbose runs report every problem
+            errors = list(errors)
+        else:
+            # otherwise stop at the first problem, skipping the remaining (file system) checks
+            errors = list(itertools.islice(errors, 1))
+
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        logger.debug("Set final arguments:")
 
         for k, v in self.processed_args.items():
             setattr(self, k, v)
+            logger.debug("\t%s: %s", k, v)
 
-            if self.ARGUMENTS_DEBUG:
-                print(f"\t{k}: {v}")
-
-        if self.ARGUMENTS_DEBUG:
-            print("Arguments Accepted")
+        logger.debug("Arguments Accepted")
 
     def get_arg_value(self, arg):
         pass
@@ -52,7 +211,7 @@ class Arguments:
     def process_raw_args(self):
         # Get and check args
         ret = {
-            "direction": self.raw_args.dir[0],
+            "direction": self.raw_args.dir,
             "indi_file": self.raw_args.indi_file,
             "fam_file": self.raw_args.fam_file,
             "sour_file": self.raw_args.sour_file,
@@ -62,194 +221,77 @@ class Arguments:
             "force_string_dates": self.raw_args.force_string_dates,
         }
 
-        self.ARGUMENTS_DEBUG = ret["verbose"]
+        # the direction is fixed for the run, so pick its file validator once
+        self._validate = _VALIDATORS[ret["direction"]]
 
-        if self.ARGUMENTS_DEBUG:
-            os.environ["VERBOSE_OUTPUT"] = "True"
-            print("----Raw Arguments----")
-            print(f"\tdirection: {ret['direction']}")
-            print(f"\tindi_file: {ret['indi_file']}")
-            print(f"\tfam_file: {ret['fam_file']}")
-            print(f"\tsour_file: {ret['sour_file']}")
-            print(f"\tgedcome_file: {ret['gedcom_file']}")
-            print(f"\tno_cont_conc: {ret['no_cont_conc']}")
-            print(f"\tforce_string_dates: {ret['force_string_dates']}")
-
-        if ret["gedcom_file"] is None:
-            ret["gedcom_file"] = self.derive_file_path(identifier="gedcom", ext=".ged")
-        else:
-            ret["gedcom_file"] = Path(ret["gedcom_file"][0])
+        logger.debug("----Raw Arguments----")
+        for k, v in ret.items():
+            logger.debug("\t%s: %s", k, v)
 
-        if ret["indi_file"] is None:
-            ret["indi_file"] = self.derive_file_path(identifier="indi", ext=".csv")
-        else:
-            ret["indi_file"] = Path(ret["indi_file"][0])
-
-        if ret["fam_file"] is None:
-            ret["fam_file"] = self.derive_file_path(identifier="fam", ext=".csv")
-        else:
-            ret["fam_file"] = Path(ret["fam_file"][0])
-
-        if ret["sour_file"] is None:
-            ret["sour_file"] = self.derive_file_path(identifier="sour", ext=".sour")
-        else:
-            ret["sour_file"] = Path(ret["sour_file"][0])
+        # file paths that were not provided are derived from the identifier and extension
+        for key, identifier, ext in _FILE_SPECS:
+            if ret[key] is None:
+                ret[key] = self.derive_file_path(identifier=identifier, ext=ext)
 
         return ret
 
-    def validate_args(
-        self,
-        direction: str,
-        gedcom_file: str,
-        indi_file: str,
-        fam_file: str,
-        sour_file: str,
-        no_cont_conc: bool,
-        force_string_dates: bool,
-    ):
-        """Assert that to_file is not an existing filepath and from_file is an existing filepath"""
-        ret = []
-        if direction == "GED2CSV":
-            if not gedcom_file.exists():
-                ret.append("Invalid gedcom file. File does not exist")
-            if indi_file.exists():
-                ret.append("Invalid indi file. File already exists! I will not over-write a file!")
-            if fam_file.exists():
-                ret.append("Invalid fam file. File already exists! I will not over-write a file!")
-            if sour_file.exists():
-                ret.append("Invalid sour file. File already exists! I will not over-write a file!")
-        elif direction == "CSV2GED":
-            if not indi_file.exists():
-                ret.append("Invalid indi file. File does not exist")
-            if not fam_file.exists():
-                ret.append("Invalid fam file. File does not exist")
-            if not sour_file.exists():
-                ret.append("Invalid sour file. File does not exist")
-            if gedcom_file.exists():
-                ret.append(
-                    "Invalid gedcom file. File already exists! I will not over-write a file!"
-                )
-            if no_cont_conc:
-                ret.append("Invalid option <no_cont_conc>. Cannot apply for direction <CSV2GED>.")
-            if force_string_dates:
-                ret.append(
-                    "Invalid option <force_string_dates>. Cannot apply for direction <CSV2GED>."
-                )
-        else:
-            ret.append(f"Invalid direction <{direction}>.")
-        return ret
+    def validate(self):
+        """Yields an error message for each problem with the command-line arguments
 
-    def validate_raw_args(self):
-        """Performs basic checks to ensure arguments make some sort of sense"""
-        ret = []
+        Checks on the shape of the arguments come first, so a command line that can be rejected
+        outright never touches the file system. File paths are derived between the two stages.
+        """
+        shape_ok = True
 
-        if self.raw_args.dir[0] == "GED2CSV":
+        if self.raw_args.dir == "GED2CSV":
             if self.raw_args.gedcom_file is None:
-                ret.append("Must provide a GEDCOM file path for direction 'GED2CSV'")
-        elif self.raw_args.dir[0] == "CSV2GED":
-            if self.raw_args.indi_file is None:
-                ret.append("A INDI CSV file path must be provided for direction 'CSV2GED'")
-            if self.raw_args.fam_file is None:
-                ret.append("A FAM CSV file path must be provided for direction 'CSV2GED'")
-            if self.raw_args.sour_file is None:
-                ret.append("A SOUR CSV file path must be provided for direction 'CSV2GED'")
+                shape_ok = False
+                yield "Must provide a GEDCOM file path for direction 'GED2CSV'"
+        elif self.raw_args.dir == "CSV2GED":
+            for key, name in (("indi_file", "INDI"), ("fam_file", "FAM"), ("sour_file", "SOUR")):
+                if getattr(self.raw_args, key) is None:
+                    shape_ok = False
+                    yield f"A {name} CSV file path must be provided for direction 'CSV2GED'"
+            for option in ("no_cont_conc", "force_string_dates"):
+                if getattr(self.raw_args, option):
+                    shape_ok = False
+                    yield f"Invalid option <{option}>. Cannot apply for direction <CSV2GED>."
         else:
-            ret.append(f"Received invalid direction {self.raw_args.dir}")
+            shape_ok = False
+            yield f"Received invalid direction {self.raw_args.dir}"
 
-        return ret
+        if not shape_ok:
+            return
 
-    def parse_args(self):
-        """ """
-        p = argparse.ArgumentParser(
-            description="Convert GEDCOM files to CSV and CSV files to GEDCOM"
-        )
+        # derive file names if needed
+        self.processed_args = self.process_raw_args()
 
-        p.add_argument(
-            "-d",
-            "--direction",
-            help="Which way to convert. GED2CSV or CSV2GED",
-            action="store",
-            nargs=1,
-            type=str,
-            choices=["GED2CSV", "CSV2GED"],
-            required=True,
-            dest="dir",
+        # Final validation. Files actually exist? etc..
+        yield from self._validate(
+            gedcom_file=self.processed_args["gedcom_file"],
+            indi_file=self.processed_args["indi_file"],
+            fam_file=self.processed_args["fam_file"],
+            sour_file=self.processed_args["sour_file"],
         )
 
-        p.add_argument(
-            "-g",
-            "--gedcom",
-            help="File path to the gedcom file to be read or generated",
-            action="store",
-            nargs=1,
-            type=str,
-            required=False,
-            dest="gedcom_file",
-        )
+    def parse_args(self, args=None):
+        """Parses the command-line arguments with the shared, lazily built parser"""
+        return _build_parser().parse_args(args)
 
-        p.add_argument(
-            "-i",
-            "--indi-file",
-            help="File path to the indi csv file to be read or generated",
-            action="store",
-            nargs=1,
-            type=str,
-            required=False,
-            dest="indi_file",
-        )
+    @functools.cached_property
+    def dt(self) -> str:
+        """Timestamp used in derived file paths. Only computed if a path has to be derived"""
+        return datetime.now().strftime("%Y%m%d-%H%M%S")
 
-        p.add_argument(
-            "-f",
-            "--fam-file",
-            help="File path to the fam csv file to be read or generated",
-            action="store",
-            nargs=1,
-            type=str,
-            required=False,
-            dest="fam_file",
-        )
-
-        p.add_argument(
-            "-s",
-            "--sour-file",
-            help="File path to the sour csv file to be read or generated",
-            action="store",
-            nargs=1,
-            type=str,
-            required=False,
-            dest="sour_file",
-        )
-
-        p.add_argument(
-            "-v",
-            "--verbose",
-            help="Verbose",
-            action="store_true",
-            dest="verbose",
-        )
-
-        p.add_argument(
-            "--no-cont-conc",
-            help="Do not attempt to handle CONT or CONC tags. Render <<MISSING DATA>> instead.",
-            action="store_true",
-            dest="no_cont_conc",
-        )
-
-        p.add_argument(
-            "--force-string-dates",
-            help="Prepend a `'` to the beginning of each date field value when converting GEDCOM to CSV.",
-            action="store_true",
-            dest="force_string_dates",
-        )
-
-        return p.parse_args()
+    @functools.cached_property
+    def output_dir(self) -> Path:
+        """The directory derived file paths live in. Created the first time it is needed"""
+        ret = Path.home().joinpath("GedcomParser", self.dt)
+        ret.mkdir(parents=True, exist_ok=True)
+        return ret
 
     def derive_file_path(self, identifier, ext):
-        parent = Path.home().joinpath("GedcomParser", self.dt)
-
-        parent.mkdir(parents=True, exist_ok=True)
-        ret = parent.joinpath(f"{identifier}_{self.dt}{ext}")
-        if self.ARGUMENTS_DEBUG:
-            print("Creating file path for:")
-            print(f"\t{ret}")
+        ret = self.output_dir.joinpath(f"{identifier}_{self.dt}{ext}")
+        logger.debug("Creating file path for:")
+        logger.debug("\t%s", ret)
         return ret
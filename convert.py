@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 import os
 from arguments import Arguments
-from parsers.gedcom_file import GedcomFile
 
 
 if __name__ == "__main__":
@@ -18,14 +17,14 @@ if __name__ == "__main__":
     force_string_dates = args.force_string_dates
 
     if direction == "GED2CSV":
+        # imported here so that argument errors don't pay for loading the parsers
+        from parsers.gedcom_file import GedcomFile
 
-        with open(gedcom_file, "r") as f:
-            gedcom_str = f.read()
-
-        gedcom_file = GedcomFile(
-            gedcom_str=gedcom_str,
+        gedcom_file = GedcomFile.from_path(
+            gedcom_file,
             no_cont_conc=no_cont_conc,
             force_string_dates=force_string_dates,
+            verbose=verbose,
         )
 
         if verbose:
@@ -33,14 +32,11 @@ if __name__ == "__main__":
 
         parts = gedcom_file.to_csv_strs()
 
-        with open(indi_file, "w") as f:
-            f.write(parts["INDI"])
-
-        with open(fam_file, "w") as f:
-            f.write(parts["FAM"])
-
-        with open(sour_file, "w") as f:
-            f.write(parts["SOUR"])
+        # "x" opens with O_EXCL, so a file that appeared since argument validation is never
+        # over-written. Each part is written with a single large buffered write
+        for path, key in ((indi_file, "INDI"), (fam_file, "FAM"), (sour_file, "SOUR")):
+            with open(path, "x", buffering=1 << 20, encoding="utf-8") as f:
+                f.write(parts[key])
 
     elif direction == "CSV2GED":
         exit(3)
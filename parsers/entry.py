@@ -1,10 +1,17 @@
 import re
-from envparse import env
+import sys
 from typing import List, Optional, Union
 
 GEDCOM_MAX_LINE_LENGTH = 80
 
 
+def _debug_print(label: str, items) -> None:
+    """Prints label followed by each item on its own indented line. Callers check their debug flag first"""
+    print(label)
+    for x in items:
+        print(f"\t{x}")
+
+
 class Line:
     """Represents a single line of a gedcom file
 
@@ -19,7 +26,11 @@ class Line:
     2 DATE 1876
     """
 
-    _LINE_RE = re.compile(r"^(?P<depth>[0-9]+) (?P<tag>[0-9A-Z_]+)(?: (?P<tag_value>.*))?$")
+    # a gedcom file yields one Line per line, so skip the per-instance __dict__
+    __slots__ = ("depth", "tag", "tag_value", "_line")
+
+    # the characters a tag may consist of
+    _TAG_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
 
     def __init__(self, depth: Union[str, int], tag: str, tag_value: Optional[str] = None):
         r"""
@@ -32,13 +43,25 @@ class Line:
         tag_value: Optional[str], default: None
             The value corresponding to the tag. E.g. "John \Cleese\"
         """
-        self.depth = depth
+        # depth, tag, and tag_value are plain attributes, read for every line of every entry. So they are
+        # checked here, once, rather than by property setters
+        if not isinstance(depth, (str, int)):
+            raise ValueError(f"invalid depth type of {type(depth)}")
+        if not isinstance(tag, str):
+            raise ValueError(f"invalid tag type of {type(tag)}")
+        if tag_value is not None and not isinstance(tag_value, str):
+            raise ValueError(f"invalid tag_value type of {type(tag_value)}")
+
+        self.depth = int(depth)
         self.tag = tag
         self.tag_value = tag_value
 
     @staticmethod
-    def get_parts_from_line(line: str) -> dict:
-        r"""Accepts a gedcome line, parses its constituent parts and returns them as a dictionary
+    def get_parts_from_line(line: str) -> tuple:
+        r"""Accepts a gedcome line, parses its constituent parts and returns them as a tuple
+
+        Only the first two spaces are looked for, so the tag value is never scanned. The depth must be
+        digits and the tag uppercase letters, digits, and underscores, or ValueError is raised.
 
         Parameters
         ----------
@@ -46,22 +69,45 @@ class Line:
 
         Returns
         -------
-        dict
-            with keys "depth", "tag", and "tag_value". All values in the dict are strings, though "tag_value"
-            may have a value of None.
+        tuple
+            (depth, tag, tag_value). All values are strings, though tag_value may be None.
         """
 
-        m = Line._LINE_RE.match(line)
+        # locate the first two spaces and slice the parts out directly, without building a list
+        first = line.find(" ")
+        if first == -1:
+            raise ValueError(f"Invalid gedcom line recieved: {line}")
+
+        second = line.find(" ", first + 1)
+        depth = line[:first]
+        if second == -1:
+            tag, tag_value = line[first + 1 :], None
+        else:
+            tag, tag_value = line[first + 1 : second], line[second + 1 :]
 
-        if not m:
+        if (
+            not (depth.isascii() and depth.isdecimal())
+            or not tag
+            or not Line._TAG_CHARS.issuperset(tag)
+        ):
             raise ValueError(f"Invalid gedcom line recieved: {line}")
 
-        return m.groupdict()
+        return depth, tag, tag_value
+
+    @classmethod
+    def _fast_new(cls, depth: str, tag: str, tag_value: Optional[str]):
+        """Creates a Line from parts that are already known to be valid, skipping the checks in __init__"""
+        ret = cls.__new__(cls)
+        ret.depth = int(depth)
+        ret.tag = tag
+        ret.tag_value = tag_value
+        return ret
 
     @classmethod
     def from_str(cls, line: str):
         """Accepts a string and returns a Line object"""
-        return cls(**cls.get_parts_from_line(line))
+        # get_parts_from_line has already checked the parts, so __init__'s checks can be skipped
+        return cls._fast_new(*cls.get_parts_from_line(line))
 
     def to_str(self) -> str:
         """Converts a line object to a string"""
@@ -81,12 +127,12 @@ class Line:
         2, meaning this is a second-order property of a base entry (a first-order
         property of a NAME line, probably).
         """
-        return Line.get_parts_from_line(line=line)["depth"]
+        return Line.get_parts_from_line(line)[0]
 
     @staticmethod
     def get_tag_from_line(line: str) -> str:
         """Returns the tag name from a gedcom file line. E.g. 'NAME', 'BIRT', 'FAMS'"""
-        return Line.get_parts_from_line(line=line)["tag"]
+        return Line.get_parts_from_line(line)[1]
 
     @staticmethod
     def get_tag_value_from_line(line: str) -> str:
@@ -96,7 +142,7 @@ class Line:
         E.g. the line '1 NAME Dorothy Adela /Popp/` returns 'Dorothy Adela /Popp/`
         E.g. the line '1 BIRT' returns None
         """
-        return Line.get_parts_from_line(line=line)["tag_value"]
+        return Line.get_parts_from_line(line)[2]
 
     @property
     def line(self):
@@ -109,72 +155,66 @@ class Line:
         else:
             self._line = val
 
-    @property
-    def depth(self):
-        return self._depth
-
-    @depth.setter
-    def depth(self, val):
-        if not isinstance(val, (str, int)):
-            raise ValueError(f"invalid depth type of {type(val)}")
-        else:
-            self._depth = int(val)
-
-    @property
-    def tag(self):
-        return self._tag
-
-    @tag.setter
-    def tag(self, val):
-        if not isinstance(val, str):
-            raise ValueError(f"invalid tag type of {type(val)}")
-        else:
-            self._tag = val
-
-    @property
-    def tag_value(self):
-        return self._tag_value
-
-    @tag_value.setter
-    def tag_value(self, val):
-        if val is not None and not isinstance(val, str):
-            raise ValueError(f"invalid tag_value type of {type(val)}")
-        else:
-            self._tag_value = val
-
 
 class Entry:
     """Class to manage an entry. Where an entry is an entire INDI, FAM, or SOUR entry in a gedcom file"""
 
+    __slots__ = (
+        "id",
+        "type",
+        "force_string_dates",
+        "no_cont_conc",
+        "ENTRY_DEBUG",
+        "_lines",
+        "_lines_cache",
+    )
+
     _EMPTY_LINE_PLACEHOLDER = "<<NONE>>"
     _CONT_PLACEHOLDER = "<<CONT>>"
     _MISSING_DATA_PLACEHOLDER = "<<MISSING DATA>>"
-    _CONT_RE = re.compile("^\d+ CONT (?P<value>.*)")
-    _CONC_RE = re.compile("^\d+ CONC (?P<value>.*)")
     _EMPTY_LINE_RE = re.compile(r"^\d+ [A-Z_]{3,5}$")
     _FIRST_LINE_RE = re.compile(r"^0 (?P<id>@[IFS]\d+@) (?P<type>(?:INDI|FAM|SOUR))$")
+    # patterns applied to all the lines of an entry joined by newlines. is_cont_conc applies the rule
+    # of _CONT_CONC_RE to a single line
+    _CONT_CONC_RE = re.compile(r"\n\d+ (CONT|CONC)(?: |$)", re.MULTILINE)
+    _EMPTY_LINE_CONT_RE = re.compile(
+        r"^(\d+ (?!CON[CT]$)[A-Z_]{3,5})(?=\n\d+ CONT(?: |$))", re.MULTILINE
+    )
+    _EMPTY_LINE_CONC_RE = re.compile(r"^\d+ (?!CON[CT]$)[A-Z_]{3,5}\n\d+ CONC(?: |$)", re.MULTILINE)
 
     _DATE_TAG = "DATE"
+    _CONT_TAG = "CONT"
+    _CONC_TAG = "CONC"
     _ACTIVE_TAG_SEPARATOR = "+"
     _SUFFIX_SEPARATOR = "~"
 
-    def __init__(self, lines: List[str], force_string_dates: bool, no_cont_conc: bool) -> None:
+    # how much of a line can be kept when the missing data placeholder is added to it
+    _MISSING_DATA_BUDGET = GEDCOM_MAX_LINE_LENGTH - len(_MISSING_DATA_PLACEHOLDER)
+    # how much of a CONT or CONC line is left for the value after the tag and two spaces, less the depth
+    _CONT_CONC_ROOM = GEDCOM_MAX_LINE_LENGTH - len(_CONC_TAG) - 2
+
+    def __init__(
+        self, lines: List[str], force_string_dates: bool, no_cont_conc: bool, verbose: bool = False
+    ) -> None:
         f"""
         Parameters
         ----------
         lines: List[str]
             A list of strings where each item in the list is a line of a gedcome file pertaining to the entry.
-            The order is assumed to be top -> bottom as if reading the gedcom file
+            The order is assumed to be top -> bottom as if reading the gedcom file. Lines must not include
+            their line endings; these are stripped once when the file is read.
         force_string_dates: bool
             A flag that, when True, will add a single-quote (') in front of DATE values. This should force excel to render
             these values as strings rather than attempt to interpret them as dates. Which it isn't super good at.
         no_cont_conc: bool
             A flag that, when True, disables attempts to preserve all CONT and CONC data. Instead a missing data
             string is put in place of CONT and CONC continued/concatenated values.
+        verbose: bool, default: False
+            A flag that, when True, prints debugging output while the entry is processed.
         """
 
         # the first line is not like the others. It contians the type of entry, and the id number
-        self.ENTRY_DEBUG = env("VERBOSE_OUTPUT", cast=bool, default=False)
+        self.ENTRY_DEBUG = verbose
 
         # set self.id and self.type
         for k, v in self.get_first_line_dict(lines[0]).items():
@@ -194,23 +234,56 @@ class Entry:
 
         return match.groupdict()
 
+    @staticmethod
+    def is_cont_conc(line: str) -> bool:
+        """Returns True if line is a CONT or CONC line. A CONT or CONC line may have no value
+
+        The tag is checked with a plain string comparison rather than a regex, since almost every
+        line is neither. Like _CONT_CONC_RE, the depth must be a number.
+        """
+        # only the four characters after the first space are sliced out, so the value of an ordinary line is
+        # never copied
+        start = line.find(" ") + 1
+        if not start:
+            return False
+
+        end = start + 4
+        tag = line[start:end]
+        if tag != Entry._CONT_TAG and tag != Entry._CONC_TAG:
+            return False
+        if len(line) > end and line[end] != " ":
+            # a longer tag that happens to start with CONT or CONC
+            return False
+
+        # isdecimal() accepts the same characters as \d
+        return line[: start - 1].isdecimal()
+
     @property
     def lines(self) -> List[str]:
-        """Returns self.lines as a list of strings"""
-        return self.add_cont_conc([l.to_str() for l in self._lines])
+        """Returns self.lines as a list of strings. Formatted on first access, then reused"""
+        if self._lines_cache is None:
+            self._lines_cache = self.add_cont_conc(self._lines)
+        return self._lines_cache
 
     @lines.setter
     def lines(self, val) -> None:
         """Sets self.lines. Stores lines as line objects under the hood"""
         if not isinstance(val, list):
             raise ValueError(f"lines must be an instance of list, go {type(val)}")
-        elif not all([isinstance(v, str) for v in val]):
+        elif not all(isinstance(v, str) for v in val):
             raise ValueError("All lines must be string values")
         else:
+            # any previously formatted lines are stale now
+            self._lines_cache = None
             if self.no_cont_conc:
-                self._lines = [Line.from_str(l) for l in self.remove_cont_conc(val)]
+                val = self.remove_cont_conc(val)
             else:
-                self._lines = [Line.from_str(l) for l in self.collapse_cont_conc(val)]
+                val = self.collapse_cont_conc(val)
+
+            # build every Line in one pass with the parsing and construction steps of Line.from_str bound locally
+            get_parts = Line.get_parts_from_line
+            fast_new = Line._fast_new
+            self._lines = [fast_new(*get_parts(l)) for l in val]
 
     def remove_cont_conc(self, lines: List[str]) -> List[str]:
         r"""Removes CONT and CONC tags from a list of lines. Replaces them with a warning string
@@ -233,45 +306,35 @@ class Entry:
 
         ret = []
         skip = False
+        max_prev_len = self._MISSING_DATA_BUDGET
         for i, line in enumerate(lines):
+            if not self.is_cont_conc(line):
+                skip = False
+                ret.append(line)
+                continue
 
-            # eliminate trailing newline characters
-            if line.endswith("\n"):
-                line = line[:-1]
+            assert i > 0
 
-            if self._CONT_RE.match(line) or self._CONC_RE.match(line):
-                assert i > 0
+            # the placeholder should only be added once per series of CONT/CONCs. So, skip is set to True
+            # on the first CONT/CONC found and it is handled. Then it is re-set to False upon detecting the
+            # next line that does not contain a CONT/CONC tag
+            if skip:
+                continue
+            skip = True
 
-                # the logic in the below else statement should only be executed once per series of CONT/CONCs. So,
-                # skip is set to True on the first CONT/CONC found and it is handled. Then it is re-set to False
-                # upon detecting the next line that does not contain a CONT/CONC tag
-                if skip:
-                    pass
-                else:
-                    prev_line = ret[-1]
-                    skip = True
-
-                    if len(prev_line) > GEDCOM_MAX_LINE_LENGTH - len(
-                        self._MISSING_DATA_PLACEHOLDER
-                    ):
-                        # cut off the previous line so that the missing data placeholder can fit, then append the missing data placeholder
-                        ret[
-                            -1
-                        ] = f"{prev_line[:GEDCOM_MAX_LINE_LENGTH - len(self._MISSING_DATA_PLACEHOLDER)]}{self._MISSING_DATA_PLACEHOLDER}"
-                    elif self._EMPTY_LINE_RE.match(prev_line):
-                        # Add the missing data placeholder, but make sure there is a space between it and the tag
-                        prev_line = f"{prev_line} {self._MISSING_DATA_PLACEHOLDER}"
-                    else:
-                        # Add the missing data placeholder
-                        prev_line = f"{prev_line}{self._MISSING_DATA_PLACEHOLDER}"
-            else:
-                skip = False
-                ret.append(line)
+            prev_line = ret[-1]
+            if len(prev_line) > max_prev_len:
+                # cut off the previous line so that the missing data placeholder can fit
+                prev_line = prev_line[:max_prev_len]
+            elif self._EMPTY_LINE_RE.match(prev_line):
+                # make sure there is a space between the missing data placeholder and the tag
+                prev_line = f"{prev_line} "
+
+            # the previous line is rewritten once, however many CONT/CONC lines follow it
+            ret[-1] = f"{prev_line}{self._MISSING_DATA_PLACEHOLDER}"
 
         if self.ENTRY_DEBUG:
-            print("REMOVE_CONT_CONC results:")
-            for x in ret:
-                print(f"\t{x}")
+            _debug_print("REMOVE_CONT_CONC results:", ret)
 
         return ret
 
@@ -296,151 +359,77 @@ class Entry:
         """
         """Removes CONT and CONC tags in a list of lines by combining those lines into one line"""
 
-        ret = []
-
-        for i, line in enumerate(lines):
+        if not lines:
+            return []
 
-            # remove errant trailing newline characters
-            if line.endswith("\n"):
-                line = line[:-1]
+        assert not self.is_cont_conc(lines[0])
 
-            cont_match = self._CONT_RE.match(line)
-            conc_match = self._CONC_RE.match(line)
+        # fold the whole entry in one pass of the regex engine rather than line by line. A CONT or CONC line is
+        # folded into the line before it by replacing the newline, depth, and tag with the CONT placeholder or
+        # nothing, respectively.
+        buf = "\n".join(lines)
 
-            assert not (cont_match and conc_match)
+        # by definition, CONC tags are not applied to empty lines
+        assert not self._EMPTY_LINE_CONC_RE.search(buf)
 
-            if cont_match:
+        # if a continued line is nothing but a depth and tag, there needs to be a space before the CONT
+        buf = self._EMPTY_LINE_CONT_RE.sub(r"\1 ", buf)
+        buf = self._CONT_CONC_RE.sub(
+            lambda m: self._CONT_PLACEHOLDER if m.group(1) == self._CONT_TAG else "", buf
+        )
 
-                assert i != 0
-
-                if self._EMPTY_LINE_RE.match(ret[-1]):
-                    # if ret[-1] is nothing but a depth and tag, there needs to be a space before the CONT
-                    ret[-1] = f"{ret[-1]} {self._CONT_PLACEHOLDER}{cont_match.groupdict()['value']}"
-                else:
-                    ret[-1] = f"{ret[-1]}{self._CONT_PLACEHOLDER}{cont_match.groupdict()['value']}"
-
-            elif conc_match:
-                assert i != 0
-                assert not self._EMPTY_LINE_RE.match(ret[-1])
-                # simply append the concatenated value. No need to check for empty tags as by definition, conc
-                # tags are not applied to empty lines
-                ret[-1] = f"{ret[-1]}{conc_match.groupdict()['value']}"
-            else:
-                # no processing necessary. Just append and move on
-                ret.append(line)
+        ret = buf.split("\n")
 
         if self.ENTRY_DEBUG:
-            print("COLLAPSE_CONT_CONC results:")
-            for x in ret:
-                print(f"\t{x}")
+            _debug_print("COLLAPSE_CONT_CONC results:", ret)
 
         return ret
 
-    @staticmethod
-    def add_cont_conc(lines: List[str]) -> List[str]:
-        def get_tag_value_chunk(depth: Union[int, str], tag: str, tag_value: str):
-            """Helper function to determine when and how to split a tag value
-            Parameters
-            ----------
-            depth: Union[int, str]
-                the depth value for the line being examined
-            tag: str
-                the tag for the line being examined. E.g. DATE, PLAC or BURI
-            tag_value: str
-                the rest of the line being examined
-
-            Returns
-            -------
-            Tuple[bool, str, str, Union[str, None]]
-                [0] - boolean: whether the tag_value needed to be split or not
-                [1] - str: The tag for this line. Original tag, CONC, or CONT
-                [2] - str: the value of the split-off section of tag_value
-                [3] - str|None: the remainder of tag_value
-            """
-
-            ret = (False, tag, tag_value, None)
-
-            if tag_value is not None:
-                len_depth = len(str(depth))
-                len_tag = len(tag)
-                len_tag_value = len(tag_value)
-                num_spaces = 2
-
-                if (
-                    len_depth + len_tag + len_tag_value + num_spaces > GEDCOM_MAX_LINE_LENGTH
-                    or tag_value.find(self._CONT_PLACEHOLDER) != -1
-                ):
-                    newline_index = tag_value.find(self._CONT_PLACEHOLDER)
-
-                    if newline_index != -1:
-                        if (
-                            len_depth + len_tag + num_spaces + newline_index
-                        ) < GEDCOM_MAX_LINE_LENGTH:
-                            ret = (
-                                True,
-                                "CONT",
-                                tag_value.split(self._CONT_PLACEHOLDER)[0],
-                                self._CONT_PLACEHOLDER.join(
-                                    tag_value.split(self._CONT_PLACEHOLDER)[1:]
-                                ),
-                            )
-                        else:
-                            ret = (
-                                True,
-                                "CONC",
-                                tag_value[
-                                    : GEDCOM_MAX_LINE_LENGTH - 1 - len_depth - len_tag - num_spaces
-                                ],
-                                tag_value[
-                                    GEDCOM_MAX_LINE_LENGTH - 1 - len_depth - len_tag - num_spaces :
-                                ],
-                            )
-                    else:
-                        ret = (
-                            True,
-                            "CONC",
-                            tag_value[: GEDCOM_MAX_LINE_LENGTH - len_depth - len_tag - num_spaces],
-                            tag_value[GEDCOM_MAX_LINE_LENGTH - len_depth - len_tag - num_spaces :],
-                        )
-                else:
-                    pass
-            else:
-                pass
+    def add_cont_conc(self, lines: List[Line]) -> List[str]:
+        """Converts Line objects to strings, splitting long and multi-line values with CONC and CONT
 
-            return ret
+        The depth, tag, and tag_value of each line are read straight off of the Line objects, so lines are
+        only ever formatted, never re-parsed.
+        """
 
         if self.ENTRY_DEBUG:
-            print("ADD_CONT_CONC input:")
-            for x in lines:
-                print(f"\t{x}")
+            _debug_print("ADD_CONT_CONC input:", (x.to_str() for x in lines))
 
         ret = []
-        for i, line in enumerate(lines):
-
-            depth = int(Line.get_depth_from_line(line))
-            tag = Line.get_tag_from_line(line)
-            tag_value = Line.get_tag_value_from_line(line)
-
-            need_split, new_tag, tag_value, next_tag_value = get_tag_value_chunk(
-                depth, tag, tag_value
-            )
-
-            ret.append(f"{depth} {tag} {tag_value}")
-
-            while need_split:
-                (need_split, new_tag, prev_tag_value, next_tag_value) = get_tag_value_chunk(
-                    depth + 1, new_tag, next_tag_value
-                )
-
-                if prev_tag_value:
-                    ret.append(f"{depth + 1} {new_tag} {prev_tag_value}")
+        for line in lines:
+
+            depth = line.depth
+            tag = line.tag
+            tag_value = line.tag_value
+
+            if tag_value is None:
+                ret.append(f"{depth} {tag}")
+                continue
+
+            # CONT and CONC lines sit one level deeper than the line they continue. room is what is left of a
+            # line for the value after the depth, the tag, and two spaces
+            sub_depth = depth + 1
+            room = GEDCOM_MAX_LINE_LENGTH - len(str(depth)) - len(tag) - 2
+            sub_room = self._CONT_CONC_ROOM - len(str(sub_depth))
+
+            # each line break in the value starts a CONT line, and whatever does not fit on a line spills over
+            # onto CONC lines
+            for i, segment in enumerate(tag_value.split(self._CONT_PLACEHOLDER)):
+                if i == 0:
+                    ret.append(f"{depth} {tag} {segment[:room]}")
+                    start = room
+                elif segment:
+                    ret.append(f"{sub_depth} {self._CONT_TAG} {segment[:sub_room]}")
+                    start = sub_room
                 else:
-                    ret.append(f"{depth + 1} {new_tag}")
+                    ret.append(f"{sub_depth} {self._CONT_TAG}")
+                    continue
 
-        if PARSER_DEBUG:
-            print("ADD_CONT_CONC results:")
-            for x in ret:
-                print(f"\t{x}")
+                for j in range(start, len(segment), sub_room):
+                    ret.append(f"{sub_depth} {self._CONC_TAG} {segment[j : j + sub_room]}")
+
+        if self.ENTRY_DEBUG:
+            _debug_print("ADD_CONT_CONC results:", ret)
 
         return ret
 
@@ -476,6 +465,9 @@ class Entry:
         # a stack of active tags. The tags are concatenated together to form column headers
         active_tags = []
 
+        # the number of times each column header has been seen before suffixes are applied
+        seen_counts = {}
+
         # iterate through the Line objects directly
         for i, line in enumerate(self._lines):
 
@@ -483,14 +475,18 @@ class Entry:
             # indicates how many of the active tags are still relevant. (The current line contributes
             # an active tag. Thus, the length of active tags should always equal the depth of the line
             if line.depth <= len(active_tags) + 1:
-                active_tags = active_tags[: (line.depth - 1)]
+                del active_tags[line.depth - 1 :]
             active_tags.append(line.tag)
 
             # process tag_value. Tags with no value need a placeholder and date tags may need
             # adjusting depending on force_string_dates
             if line.tag_value is None:
                 tag_value = self._EMPTY_LINE_PLACEHOLDER
-            elif line.tag == self._DATE_TAG and self.force_string_dates and not tag.startswith("'"):
+            elif (
+                line.tag == self._DATE_TAG
+                and self.force_string_dates
+                and not line.tag_value.startswith("'")
+            ):
                 tag_value = f"'{line.tag_value}"
             else:
                 tag_value = line.tag_value
@@ -501,16 +497,23 @@ class Entry:
             #   "NAME+GIVN": "value",
             #   "NAME+GIVN_1": "other value",
             # }
-            suffix = 0
-            while self._ACTIVE_TAG_SEPARATOR.join(active_tags) in ret:
-                suffix += 1
+            # The nth repeat of a header is always given suffix n, so a count per header replaces
+            # probing ret for the first free suffix.
+            key = self._ACTIVE_TAG_SEPARATOR.join(active_tags)
+            suffix = seen_counts.get(key, 0)
+            seen_counts[key] = suffix + 1
+            if suffix:
+                # the suffix goes on the last tag, which ends the key, so the key needs no re-join. The
+                # suffixed tag stays on the stack for the headers of any sub-properties
                 active_tags[-1] = f"{line.tag}{self._SUFFIX_SEPARATOR}{suffix}"
+                key = f"{key}{self._SUFFIX_SEPARATOR}{suffix}"
 
-            ret["+".join(active_tags)] = tag_value
+            # the same headers come up in entry after entry. Interning lets every row dict share one
+            # string per header, which also makes the lookups when the rows are gathered into columns
+            # identity checks
+            ret[sys.intern(key)] = tag_value
 
         if self.ENTRY_DEBUG:
-            print("--ENTRY AS DICT--")
-            for k, v in ret.items():
-                print(f"\t{k}: {v}")
+            _debug_print("--ENTRY AS DICT--", (f"{k}: {v}" for k, v in ret.items()))
 
         return ret
@@ -1,7 +1,8 @@
-import pandas as pd
+import bisect
+import csv
+import io
 import re
 
-from envparse import env
 from typing import Union
 
 from .entry import Entry
@@ -15,29 +16,62 @@ GEDCOM_MAX_LINE_LENGTH = 80
 
 
 class GedcomFile:
+    # patterns for the first line of each type of entry. Compiled once, shared by every instance
+    indi_regex = re.compile(r"^\d+ @I\d+@ INDI$")
+    fam_regex = re.compile(r"^\d+ @F\d+@ FAM$")
+    sour_regex = re.compile(r"^\d+ @S\d+@ SOUR$")
+    _SECTION_PATTERNS = {"indi": indi_regex, "fam": fam_regex, "sour": sour_regex}
+    # the first line of each type of entry is "0 @" + letter + digits + suffix. Keyed by that letter, so
+    # one lookup picks the only section a line could begin. A cheaper stand-in for the patterns
+    _SECTION_KEYS = {
+        "I": ("indi", "@ INDI"),
+        "F": ("fam", "@ FAM"),
+        "S": ("sour", "@ SOUR"),
+    }
+
     def __init__(
         self,
         gedcom_str,
         no_cont_conc,
         force_string_dates,
+        verbose=False,
     ):
-        self.PARSER_DEBUG = env("VERBOSE_OUTPUT", cast=bool, default=False)
+        self.PARSER_DEBUG = verbose
 
         self.gedcom_str = gedcom_str
+        self.gedcom_lines = None
+        self._section_indexes = None
+        self._entry_lines = None
 
         self.no_cont_conc = no_cont_conc
         self.force_string_dates = force_string_dates
 
-        self.indi_regex = re.compile(r"^\d+ @I\d+@ INDI$")
-        self.fam_regex = re.compile(r"^\d+ @F\d+@ FAM$")
-        self.sour_regex = re.compile(r"^\d+ @S\d+@ SOUR$")
-
         self.entries = {
             "INDI": [],
             "FAM": [],
             "SOUR": [],
         }
 
+    @classmethod
+    def from_path(cls, path, no_cont_conc, force_string_dates, verbose=False):
+        """Creates a GedcomFile by reading the gedcom file at path line by line
+
+        The file is never held in memory as a single string alongside its list of lines.
+        """
+        ret = cls(
+            gedcom_str=None,
+            no_cont_conc=no_cont_conc,
+            force_string_dates=force_string_dates,
+            verbose=verbose,
+        )
+
+        # newline="" skips universal-newline translation. Line endings (\n or \r\n) are stripped
+        # below instead. utf-8-sig also drops the byte order mark some programs write
+        with open(path, "r", encoding="utf-8-sig", buffering=1 << 20, newline="") as f:
+            ret.gedcom_lines = [line.rstrip("\r\n") for line in f]
+
+        return ret
+
     def to_csv_strs(self):
         """Converts self into CSV strings
 
@@ -52,65 +86,39 @@ class GedcomFile:
             - "FAM": family entries csv string,
             - "SOUR": source entries csv string,
         """
-        # open the file and read lines
-        self.gedcom_lines = self.gedcom_str.split("\n")
+        # split the file into lines, unless they were already read from disk. Either way, no line keeps its
+        # line ending, so entries never have to strip them
+        if self.gedcom_lines is None:
+            # not splitlines(), which would also break lines on characters like \x85 or \u2028 that may
+            # appear within values
+            self.gedcom_lines = self.gedcom_str.replace("\r\n", "\n").split("\n")
 
-        # Find the start and stop for the indi and family sections
-        start_of_indi_section = self.get_start_section("indi")
-        end_of_indi_section = self.get_end_section("indi")
-        start_of_fam_section = self.get_start_section("fam")
-        end_of_fam_section = self.get_end_section("fam")
-        start_of_sour_section = self.get_start_section("sour")
-        end_of_sour_section = self.get_end_section("sour")
+        # Find the start and stop of every section, all in one pass over the lines
+        section_indexes = self._index_sections()
 
         if self.PARSER_DEBUG:
-            print("--Determined these indexes for INDI and FAM sections--")
-            print(f"\tfirst INDI index: {start_of_indi_section}")
-            print(f"\tlast  INDI index: {end_of_indi_section}")
-            print(f"\tfirst FAM  index: {start_of_fam_section}")
-            print(f"\tlast  FAM  index: {end_of_fam_section}")
-            print(f"\tfirst SOUR  index: {start_of_sour_section}")
-            print(f"\tlast  SOUR  index: {end_of_sour_section}")
+            print("--Determined these indexes for INDI, FAM, and SOUR sections--")
+            for section, (start, end) in section_indexes.items():
+                print(f"\tfirst {section.upper():<4} index: {start}")
+                print(f"\tlast  {section.upper():<4} index: {end}")
 
-        if self.PARSER_DEBUG:
-            print("==============PROCESSING INDI ENTRIES================")
-            assert (start_of_indi_section is None and end_of_indi_section is None) or (
-                start_of_indi_section is not None and end_of_indi_section is not None
-            )
-        if start_of_indi_section is not None and end_of_indi_section is not None:
-            self.entries["INDI"] = self.get_section_entries(
-                start_of_indi_section, end_of_indi_section
-            )
+        for section, (start, end) in section_indexes.items():
+            entry_type = section.upper()
 
-        if self.PARSER_DEBUG:
-            print("==============PROCESSING FAM ENTRIES=================")
-            assert (start_of_fam_section is None and end_of_fam_section is None) or (
-                start_of_fam_section is not None and end_of_fam_section is not None
-            )
-        if start_of_fam_section is not None and end_of_fam_section is not None:
-            self.entries["FAM"] = self.get_section_entries(start_of_fam_section, end_of_fam_section)
+            if self.PARSER_DEBUG:
+                print(f"==============PROCESSING {entry_type} ENTRIES================")
+                assert (start is None) == (end is None)
 
-        if self.PARSER_DEBUG:
-            print("==============PROCESSING SOUR ENTRIES================")
-            assert (start_of_sour_section is None and end_of_sour_section is None) or (
-                start_of_sour_section is not None and end_of_sour_section is not None
-            )
-        if start_of_sour_section is not None and end_of_sour_section is not None:
-            self.entries["SOUR"] = self.get_section_entries(
-                start_of_sour_section, end_of_sour_section
-            )
+            if start is not None and end is not None:
+                self.entries[entry_type] = self.get_section_entries(start, end)
 
         self.indi_dicts = [i.to_col_name_dict() for i in self.entries["INDI"]]
         self.fam_dicts = [f.to_col_name_dict() for f in self.entries["FAM"]]
         self.sour_dicts = [s.to_col_name_dict() for s in self.entries["SOUR"]]
 
-        self.indi_df = pd.DataFrame(self.indi_dicts)
-        self.fam_df = pd.DataFrame(self.fam_dicts)
-        self.sour_df = pd.DataFrame(self.sour_dicts)
-
-        indi_csv_str = self.indi_df.to_csv()
-        fam_csv_str = self.fam_df.to_csv()
-        sour_csv_str = self.sour_df.to_csv()
+        indi_csv_str = self.to_csv_str(self.indi_dicts)
+        fam_csv_str = self.to_csv_str(self.fam_dicts)
+        sour_csv_str = self.to_csv_str(self.sour_dicts)
 
         return {
             "INDI": indi_csv_str,
@@ -118,98 +126,160 @@ class GedcomFile:
             "SOUR": sour_csv_str,
         }
 
+    @staticmethod
+    def get_columns(dicts):
+        """Turns a list of row dicts into a dict of column name to the list of that column's values
+
+        Columns are ordered by first appearance and rows that lack a column get None.
+        """
+        ret = {}
+        num_rows = len(dicts)
+        for i, row in enumerate(dicts):
+            for k, v in row.items():
+                col = ret.get(k)
+                if col is None:
+                    col = ret[k] = [None] * num_rows
+                col[i] = v
+
+        return ret
+
+    @staticmethod
+    def to_csv_str(dicts):
+        """Writes a list of row dicts as a CSV string
+
+        The layout is the one pandas.DataFrame.to_csv gives: an unnamed index column first, then the
+        columns in order of first appearance, with empty cells where a row lacks a column.
+        """
+        columns = GedcomFile.get_columns(dicts)
+
+        if not columns:
+            # what to_csv writes for an empty DataFrame
+            return '""\n'
+
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(["", *columns])
+        # zip turns the columns back into rows. The csv module writes None as an empty cell
+        writer.writerows((i, *row) for i, row in enumerate(zip(*columns.values())))
+
+        return buf.getvalue()
+
     def get_section_entries(self, start_line_index, end_line_index):
+        gedcom_lines = self.gedcom_lines
+        force_string_dates = self.force_string_dates
+        no_cont_conc = self.no_cont_conc
+        verbose = self.PARSER_DEBUG
+
+        # the lines that begin an entry were recorded by the pass that found the sections. An entry runs
+        # up to the line that begins the next one, or the end of the section
+        self._index_sections()
+        entry_lines = self._entry_lines
+        first = bisect.bisect_left(entry_lines, start_line_index)
+        last = bisect.bisect_right(entry_lines, end_line_index)
+        entry_starts = entry_lines[first:last]
+        entry_ends = entry_starts[1:] + [end_line_index + 1]
+
         ret = []
-        i = start_line_index
-        while i <= end_line_index:
-            j = i + 1
-            while j < len(self.gedcom_lines) and not self.gedcom_lines[j].startswith("0"):
-                j += 1
+        for i, j in zip(entry_starts, entry_ends):
 
-            if self.PARSER_DEBUG:
+            if verbose:
                 # Make sure everything is looking ok
                 assert i < j
                 assert i >= start_line_index
                 assert j <= end_line_index + 1
-                assert self.gedcom_lines[i].startswith("0")
-                assert self.gedcom_lines[j].startswith("0")
+                assert gedcom_lines[i].startswith("0")
+                assert j == end_line_index + 1 or gedcom_lines[j].startswith("0")
+                assert not any(gedcom_lines[k].startswith("0") for k in range(i + 1, j))
 
                 print("------------------------")
                 print(f"RECORD LINES {i}-{j}:")
                 for k in range(i, j):
-                    print(f"\t{self.gedcom_lines[k]}")
+                    print(f"\t{gedcom_lines[k]}")
 
             ret.append(
                 Entry(
-                    lines=self.gedcom_lines[i:j],
-                    force_string_dates=self.force_string_dates,
-                    no_cont_conc=self.no_cont_conc,
+                    lines=gedcom_lines[i:j],
+                    force_string_dates=force_string_dates,
+                    no_cont_conc=no_cont_conc,
+                    verbose=verbose,
                 )
             )
-            i = j
 
         return ret
 
-    def get_start_section(self, section):
-        """Returns the index of the line that begins the first Individual entry in the gedcom file"""
-        ret = None
-
-        # validate input
-        if section == "indi":
-            pattern = self.indi_regex
-        elif section == "fam":
-            pattern = self.fam_regex
-        elif section == "sour":
-            pattern = self.sour_regex
-        else:
-            raise ValueError(f"invalid section type '{section}' provided")
+    def _index_sections(self):
+        """Finds the first and last line of every section in a single pass over the gedcom lines
 
-        # find first instance of match
-        for i, line in enumerate(self.gedcom_lines):
-            if pattern.match(line):
-                if self.PARSER_DEBUG:
-                    assert line.startswith("0")
-                ret = i
-                break
+        Returns a dict of section ("indi", "fam", "sour") to a tuple of the index of the line that
+        begins the first entry of the section and the index of the last line of its last entry. Both
+        are None if the section has no entries. Computed once, then reused.
+        """
+        if self._section_indexes is not None:
+            return self._section_indexes
+
+        starts = {}
+        ends = {}
+        # the index of every line that begins an entry, in order
+        entry_lines = []
+
+        gedcom_lines = self.gedcom_lines
+        section_keys = self._SECTION_KEYS
+        add_entry_line = entry_lines.append
+
+        # the section of the entry currently being walked through, if it belongs to one
+        current = None
+        for i, line in enumerate(gedcom_lines):
+            if not line.startswith("0"):
+                continue
+            add_entry_line(i)
+
+            # a new entry begins, so the one before it ended on the previous line
+            if current is not None:
+                ends[current] = i - 1
+                current = None
+
+            if not line.startswith("0 @"):
+                continue
+
+            section_key = section_keys.get(line[3:4])
+            if section_key is None:
+                continue
+
+            # like the patterns, the id between the letter and the suffix must be all digits
+            section, suffix = section_key
+            if line.endswith(suffix) and line[4 : -len(suffix)].isdecimal():
+                starts.setdefault(section, i)
+                current = section
+
+        # the last entry runs to the end of the file. Ignore any blank lines it ends with
+        if current is not None:
+            end = len(gedcom_lines) - 1
+            while not gedcom_lines[end]:
+                end -= 1
+            ends[current] = end
 
-        return ret
+        if self.PARSER_DEBUG:
+            # the checks in the loop stand in for the section patterns, so make sure they agree. The first
+            # line of every other entry is checked again when its Entry is created
+            for section, start in starts.items():
+                assert self._SECTION_PATTERNS[section].match(gedcom_lines[start])
+
+        self._entry_lines = entry_lines
+        self._section_indexes = {
+            section: (starts.get(section), ends.get(section)) for section in self._SECTION_PATTERNS
+        }
+        return self._section_indexes
 
-    def get_end_section(self, section):
-        """Returns the index of the line that begins the last Individual entry in the gedcom file"""
-        ret = None
-
-        # validate input
-        if section == "indi":
-            pattern = self.indi_regex
-        elif section == "fam":
-            pattern = self.fam_regex
-        elif section == "sour":
-            pattern = self.sour_regex
-        else:
+    def get_start_section(self, section):
+        """Returns the index of the line that begins the first entry of section"""
+        if section not in self._SECTION_PATTERNS:
             raise ValueError(f"invalid section type '{section}' provided")
 
-        i = len(self.gedcom_lines) - 1
-        end_found = False
-        # start from the end of the gedcom file and work backwards searching for the last
-        # INDI entry
-        while i > 0 and not end_found:
-
-            if pattern.match(self.gedcom_lines[i]):
+        return self._index_sections()[section][0]
 
-                if self.PARSER_DEBUG:
-                    assert self.gedcom_lines[i].startswith("0")
-
-                # found the last indi entry
-                end_found = True
-                i += 1
-
-                # Now start working back forwards to find the end of this indi entry
-                while i < len(self.gedcom_lines) and not self.gedcom_lines[i].startswith("0"):
-                    i += 1
-                    if self.gedcom_lines[i].startswith("0"):
-                        # i is now set to the index of the line after the end of the last entry. So
-                        # subtract one to get back to the last line of the previous entry
-                        ret = i - 1
-            i -= 1
+    def get_end_section(self, section):
+        """Returns the index of the last line of the last entry of section"""
+        if section not in self._SECTION_PATTERNS:
+            raise ValueError(f"invalid section type '{section}' provided")
 
-        return ret
+        return self._index_sections()[section][1]